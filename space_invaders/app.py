@@ -3,13 +3,15 @@ Space Invaders game
 """
 
 
-from typing import List
+import os
 
+import numpy as np
 import pygame
 from pygame.locals import *
 
 from space_invaders.constants import WIDTH
 from space_invaders.constants import HEIGHT
+from space_invaders.constants import FPS
 from space_invaders.constants import ASSETS_DIR
 
 from space_invaders.utils import logger
@@ -20,6 +22,41 @@ from space_invaders.ship import Ship
 
 from space_invaders.alien import Alien
 
+# Bound once at import so the per-frame event loop reads module-level
+# names instead of attribute lookups on the pygame module
+_QUIT = pygame.QUIT
+_KEYDOWN = pygame.KEYDOWN
+_K_SPACE = pygame.K_SPACE
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _step_aliens_kernel(pos, speed, time, half_width, width):
+        """
+        Step and bounce all the aliens in one compiled loop
+        """
+
+        right = width - half_width
+        for i in range(pos.shape[0]):
+            pos[i, 0] += speed[i, 0] * time
+            if pos[i, 0] <= half_width or pos[i, 0] >= right:
+                # Clamp to the wall instead of stepping again, so a
+                # bounce never moves the alien twice in one frame. Only
+                # the horizontal speed flips; the descent direction is
+                # constant, so every bounce moves the alien down
+                pos[i, 0] = half_width if pos[i, 0] <= half_width else right
+                speed[i, 0] = -speed[i, 0]
+                pos[i, 1] += abs(speed[i, 1]) * time
+else:
+    _step_aliens_kernel = None
+
 
 class Game:
     """
@@ -27,19 +64,17 @@ class Game:
     """
     
     _logger = logger
-    
-    _clock = pygame.time.Clock()
-    _time = 0
-    
-    _carry_on = True
-    
-    _points = 0
-    
+
     def __init__(self, name: str) -> None:
         
-        self._logger.log(f'Initializing {name}')
+        self._logger.log('Initializing %s', name)
         
         self._name = name
+
+        self._clock = pygame.time.Clock()
+        self._time = 0
+        self._carry_on = True
+        self._points = 0
         
         pygame.init()
         
@@ -78,7 +113,7 @@ class Game:
         Load the images
         """
         
-        self._logger.log(f'Loading image {file}')
+        self._logger.log('Loading image %s', file)
         
         return load_image(file) 
     
@@ -87,19 +122,39 @@ class SpaceInvaders(Game):
     Space Invaders class
     """
     
-    _alien_boxes: List[Alien] = []
-    _aliens_count = 0
-    _aliens_currnet_count = 0
-    _ship = None
-    _has_been_boosted = False
-    
     def __init__(self) -> None:
         
         super().__init__('Space Invaders')
 
+        self._aliens_count = 0
+        self._aliens_current_count = 0
+        self._ship = None
+        self._has_been_boosted = False
+
         self._screen = self._set_screen(WIDTH, HEIGHT)
         self._background_image = self._load_image(f'{ASSETS_DIR}/background.jpg')
+        self._preload_assets()
+        self._aliens = pygame.sprite.Group()
+        self._alien_sprites = []
+        self._alien_pos = np.empty((0, 2), dtype=np.float32)
+        self._alien_speed = np.empty((0, 2), dtype=np.float32)
+        self._alien_half_width = 0
         
+    def _preload_assets(self) -> None:
+        """
+        Warm the image cache with every asset in one directory pass,
+        so sprite construction later never touches the disk
+        """
+
+        self._logger.log('Preloading assets')
+
+        for name in sorted(os.listdir(ASSETS_DIR)):
+            path = f'{ASSETS_DIR}/{name}'
+            if name == 'background.jpg':
+                load_image(path)
+            else:
+                load_image(path, transparent=True)
+
     def _set_alien_boxes(self) -> None:
         """
         Set the boxes
@@ -109,12 +164,65 @@ class SpaceInvaders(Game):
         
         for x in range(100, WIDTH - 150, 100):
             for y in range(10, 200, 60):
-                self._alien_boxes.append(Alien(x, y))
+                self._aliens.add(Alien(x, y))
                 
-        self._aliens_count = len(self._alien_boxes)
-        self._aliens_currnet_count = self._aliens_count
-        self._logger.log(f'Aliens count: {self._aliens_count}')
+        self._aliens_count = len(self._aliens)
+        self._aliens_current_count = self._aliens_count
+        self._set_alien_arrays()
+        self._logger.log('Aliens count: %s', self._aliens_count)
                 
+    def _set_alien_arrays(self) -> None:
+        """
+        Build the SoA position/speed arrays for the aliens
+        """
+        
+        sprites = self._aliens.sprites()
+        self._alien_sprites = sprites
+        self._alien_pos = np.array([a.rect.center for a in sprites], dtype=np.float32)
+        self._alien_speed = np.array([a.speed for a in sprites], dtype=np.float32)
+        if sprites:
+            self._alien_half_width = sprites[0].rect.width / 2
+        
+    def _drop_dead_aliens(self) -> None:
+        """
+        Drop the killed aliens from the SoA arrays
+        """
+        
+        alive = np.array([a.alive() for a in self._alien_sprites], dtype=bool)
+        self._alien_sprites = [a for a in self._alien_sprites if a.alive()]
+        self._alien_pos = self._alien_pos[alive]
+        self._alien_speed = self._alien_speed[alive]
+        
+    def _step_aliens(self, time: int) -> None:
+        """
+        Step all the aliens in one vectorized pass
+        """
+        
+        pos = self._alien_pos
+        speed = self._alien_speed
+        if not len(pos):
+            return
+        
+        hw = self._alien_half_width
+        if _step_aliens_kernel is not None:
+            _step_aliens_kernel(pos, speed, time, hw, WIDTH)
+        else:
+            pos[:, 0] += speed[:, 0] * time
+
+            # Branchless bounce: flip the horizontal speed where a wall
+            # was hit and clamp x to the wall. The descent direction is
+            # constant, so the vertical speed is never flipped and the
+            # bounced rows always move down
+            bounced = (pos[:, 0] <= hw) | (pos[:, 0] >= WIDTH - hw)
+            sign = 1 - 2 * bounced.astype(np.int8)
+            speed[:, 0] *= sign
+            np.clip(pos[:, 0], hw, WIDTH - hw, out=pos[:, 0])
+            pos[:, 1] += np.where(bounced, np.abs(speed[:, 1]) * time, 0)
+
+        # One vectorized cast, then plain-int pairs for the write-back
+        for sprite, center in zip(self._alien_sprites, pos.astype(np.int32).tolist()):
+            sprite.rect.center = center
+        
     def _set_ship(self) -> None:
         """
         Set the ship
@@ -130,82 +238,88 @@ class SpaceInvaders(Game):
         """
         
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type == _QUIT:
                 self._logger.log('Quitting the game')
                 self._carry_on = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+            elif event.type == _KEYDOWN:
+                if event.key == _K_SPACE:
                     self._ship.shoot(self._time)
                 
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self._ship.move_left(5)
-        if keys[pygame.K_RIGHT]:
-            self._ship.move_right(5)
+        dx = (keys[_K_RIGHT] - keys[_K_LEFT]) * 5
+        if dx:
+            self._ship.move(dx)
                 
     def _handle_game_logic(self) -> None:
         """
         Handle the game logic
         """
         
-        # Check if the bullet has hit the boxes
-        if self._ship.is_shooting:
-            for bullet in self._ship.bullets:
-                for box in self._alien_boxes:
-                    if box.rect.colliderect(bullet.rect):
-                        self._alien_boxes.remove(box)
-                        self._ship.bullets.remove(bullet)
-                        self._logger.log('Hit!')
-                        self._aliens_currnet_count -= 1
-                        
-                        # If alients count
-                        if self._aliens_currnet_count <= self._aliens_count * 0.25:
-                            self._points += 10
-                        elif self._aliens_currnet_count <= self._aliens_count * 0.5:
-                            self._points += 5
-                        elif self._aliens_currnet_count <= self._aliens_count * 0.75:
-                            self._points += 3
-                        else:
-                            self._points += 1
-                            
-                        self._logger.log(f'Points: {self._points}')
+        ship = self._ship
+
+        # Check if the bullets have hit the boxes; groupcollide does all
+        # the pair tests and the kills in C. Skip the pass entirely in
+        # the common no-bullets case (len on a Group is O(1))
+        hits = {}
+        if ship.bullets:
+            hits = pygame.sprite.groupcollide(ship.bullets, self._aliens, True, True)
+        for killed in hits.values():
+            for _ in killed:
+                self._logger.log('Hit!')
+                self._aliens_current_count -= 1
+
+                # If alients count
+                if self._aliens_current_count <= self._aliens_count * 0.25:
+                    self._points += 10
+                elif self._aliens_current_count <= self._aliens_count * 0.5:
+                    self._points += 5
+                elif self._aliens_current_count <= self._aliens_count * 0.75:
+                    self._points += 3
+                else:
+                    self._points += 1
+
+                self._logger.log('Points: %s', self._points)
+
+        if hits:
+            self._drop_dead_aliens()
+            ship.drop_dead_bullets()
                         
         # if points are greater than 100, shot multiple bullets
         if self._points > 50 and not self._has_been_boosted:
-            self._ship.boost()
-            self._ship.shoot(self._time)
+            ship.boost()
+            ship.shoot(self._time)
             self._has_been_boosted = True
             
         
         # Check if there are no more boxes
-        if not self._alien_boxes:
+        if not self._aliens:
             self._logger.log('You won!')
             self._carry_on = False
             
         # Check if the boxes have reached the ship
-        for box in self._alien_boxes:
-            if box.rect.centery >= HEIGHT - 30:
-                self._logger.log('You lost!')
-                self._carry_on = False
+        if (self._alien_pos[:, 1] >= HEIGHT - 30).any():
+            self._logger.log('You lost!')
+            self._carry_on = False
     
     def _draw_stuff(self) -> None:
         """
         Draw the stuff
         """
         
-        self._screen.blit(self._background_image, (0, 0))
+        screen = self._screen
+        ship = self._ship
+
+        screen.blit(self._background_image, (0, 0))
         
-        for alien in self._alien_boxes:
-            alien.update(self._time)
-            self._screen.blit(alien.image, alien.rect)
-            
-        if self._ship.is_shooting:
-            for bullet in self._ship.bullets:
-                bullet.update()
-                self._screen.blit(bullet.image, bullet.rect)
-            
-        self._screen.blit(self._ship.image, self._ship.rect)
-            
+        self._step_aliens(self._time)
+        ship.update_bullets()
+
+        # One batched C-level call instead of one blit per sprite
+        blit_seq = [(a.image, a.rect) for a in self._alien_sprites]
+        blit_seq.extend((b.image, b.rect) for b in ship.bullets)
+        blit_seq.append((ship.image, ship.rect))
+        screen.blits(blit_seq, doreturn=False)
+
         pygame.display.flip()
                 
     def run(self) -> None:
@@ -219,7 +333,7 @@ class SpaceInvaders(Game):
         self._set_ship()
         
         while self._carry_on:
-            self._time = self._clock.tick(60)
+            self._time = self._clock.tick(FPS)
             self._handle_events()
             self._handle_game_logic()
             self._draw_stuff()
@@ -7,6 +7,8 @@ import os
 WIDTH = 800
 HEIGHT = 600
 
+FPS = 60
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-ASSETS_DIR = os.path.join(BASE_DIR, '..', 'assets')
+ASSETS_DIR = os.path.normpath(os.path.join(BASE_DIR, '..', 'assets'))
@@ -3,57 +3,144 @@ Ship class
 """
 
 
-from typing import List
+from typing import NamedTuple
 
+import numpy as np
 import pygame
 
 from space_invaders.constants import WIDTH
+from space_invaders.constants import ASSETS_DIR
 
 from space_invaders.utils import logger
 from space_invaders.utils import load_image
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _step_bullets_kernel(pos, vel, half, width, off):
+        """
+        Step all the bullets and flag off-screen ones in one compiled loop
+        """
+
+        for i in range(pos.shape[0]):
+            pos[i, 0] += vel[i, 0]
+            pos[i, 1] += vel[i, 1]
+            off[i] = (
+                pos[i, 1] - half[i, 1] <= 0
+                or pos[i, 0] - half[i, 0] <= 0
+                or pos[i, 0] + half[i, 0] >= width
+            )
+else:
+    _step_bullets_kernel = None
+
+
+class BulletSpec(NamedTuple):
+    """
+    Immutable spawn parameters for one kind of bullet
+
+    NamedTuple fields resolve through C-level tuple slots, which keeps
+    the spawn path cheap.
+    """
+
+    color: tuple
+    size: tuple
+    speed: int
+    diagonal_speed: int = 0
+
+
+_CENTER_SHOT = BulletSpec((255, 0, 0), (5, 10), 3)
+_LEFT_SHOT = BulletSpec((255, 0, 0), (5, 10), 5, diagonal_speed=2)
+_RIGHT_SHOT = BulletSpec((255, 0, 0), (5, 10), 5, diagonal_speed=-2)
+
+_bullet_surfaces = {}
+_bullet_pool = []
+
+
+def _get_bullet_surface(color: tuple, size: tuple) -> pygame.Surface:
+    """
+    Return the shared bullet Surface for a color/size, created lazily
+    after the display exists so it can be converted to screen format
+    """
+
+    surface = _bullet_surfaces.get((color, size))
+    if surface is None:
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        surface = surface.convert()
+        _bullet_surfaces[(color, size)] = surface
+
+    return surface
+
 
 class Bullet(pygame.sprite.Sprite):
     """
     Bullet class
     """
-    
-    def __init__(self, color: str, size: tuple, position: tuple, speed: int, diagonal_speed: int = 0) -> None:
-        
-        pygame.sprite.Sprite.__init__(self)
-        
-        self.image = pygame.Surface(size)
-        self.image.fill(color)
-        
+
+    def __init__(self, spec: BulletSpec, position: tuple) -> None:
+
+        super().__init__()
+
+        self.reset(spec, position)
+
+    def reset(self, spec: BulletSpec, position: tuple) -> None:
+        """
+        (Re)initialize the bullet from a spec, so pooled instances can
+        be reused without reallocating
+
+        :param spec: Spawn parameters
+        :type spec: BulletSpec
+
+        :param position: Center of the bullet
+        :type position: tuple
+        """
+
+        self.image = _get_bullet_surface(spec.color, spec.size)
+
         self.rect = self.image.get_rect()
         self.rect.center = position
-        
-        self.speed = speed
-        self.diagonal_speed = diagonal_speed
-        
-    def update(self) -> None:
+
+        self.speed = spec.speed
+        self.diagonal_speed = spec.diagonal_speed
+        self._hw = spec.size[0] // 2
+        self._hh = spec.size[1] // 2
+        self._pooled = False
+
+    def kill(self) -> None:
         """
-        Update the position of the bullet
+        Remove the bullet from its groups and return it to the free list
         """
-        
-        self.rect.centery -= self.speed
-        
-        if self.diagonal_speed > 0:
-            self.rect.centerx += self.diagonal_speed
-        elif self.diagonal_speed < 0:
-            self.rect.centerx -= self.diagonal_speed
-            
-        if self.rect.top <= 0:
-            self.kill()
-            
-        if self.rect.left <= 0:
-            self.kill()
-            
-        if self.rect.right >= WIDTH:
-            self.kill()
-            
-        if self.rect.bottom <= 0:
-            self.kill()
+
+        super().kill()
+        if not self._pooled:
+            self._pooled = True
+            _bullet_pool.append(self)
+
+
+def _acquire_bullet(spec: BulletSpec, position: tuple) -> Bullet:
+    """
+    Take a bullet from the pool, or allocate one when the pool is empty
+
+    :param spec: Spawn parameters
+    :type spec: BulletSpec
+
+    :param position: Center of the bullet
+    :type position: tuple
+
+    :return: Bullet
+    """
+
+    if _bullet_pool:
+        bullet = _bullet_pool.pop()
+        bullet.reset(spec, position)
+        return bullet
+
+    return Bullet(spec, position)
 
 class Ship(pygame.sprite.Sprite):
     """
@@ -61,49 +148,95 @@ class Ship(pygame.sprite.Sprite):
     """
     
     _logger = logger
-    
-    is_shooting = False
-    bullets: List[Bullet] = []
-    _cooldown = 0
-    _bullet_boost = False
-    
+
     def __init__(self, y: int) -> None:
-        
-        pygame.sprite.Sprite.__init__(self)
-        
-        self.image = load_image('assets/ship.jpg', transparent=True)
+
+        super().__init__()
+
+        self.is_shooting = False
+        self.bullets = pygame.sprite.Group()
+        self._bullet_sprites = []
+        self._bullet_pos = np.empty((0, 2), dtype=np.float32)
+        self._bullet_vel = np.empty((0, 2), dtype=np.float32)
+        self._bullet_half = np.empty((0, 2), dtype=np.float32)
+        self._cooldown = 0
+        self._bullet_boost = False
+
+        self.image = load_image(f'{ASSETS_DIR}/ship.jpg', transparent=True)
         
         self.rect = self.image.get_rect()
         self.rect.centerx = WIDTH / 2
         self.rect.centery = y
-        
-        self.speed = 0.5
-        
-    def move_left(self, pixels: int) -> None:
+        self._half_width = self.rect.width // 2
+
+    def move(self, pixels: int) -> None:
         """
-        Move the ship left
-        
-        :param pixels: int
+        Move the ship horizontally, clamped to the screen
+
+        :param pixels: Signed displacement, negative moves left
         :type pixels: int
         """
-        
-        self.rect.centerx -= pixels
-        
-        if self.rect.left <= 0:
-            self.rect.left = 0
-        
-    def move_right(self, pixels: int) -> None:
+
+        rect = self.rect
+        hw = self._half_width
+        rect.centerx = min(max(rect.centerx + pixels, hw), WIDTH - hw)
+
+    def _sync_bullet_arrays(self) -> None:
         """
-        Move the ship right
-        
-        :param pixels: int
-        :type pixels: int
+        Build the SoA position/velocity arrays for the bullets
         """
-        
-        self.rect.centerx += pixels
-        
-        if self.rect.right >= WIDTH:
-            self.rect.right = WIDTH
+
+        sprites = self.bullets.sprites()
+        self._bullet_sprites = sprites
+        self._bullet_pos = np.array([b.rect.center for b in sprites], dtype=np.float32).reshape(-1, 2)
+        self._bullet_vel = np.array([(b.diagonal_speed, -b.speed) for b in sprites], dtype=np.float32).reshape(-1, 2)
+        self._bullet_half = np.array([(b._hw, b._hh) for b in sprites], dtype=np.float32).reshape(-1, 2)
+
+    def drop_dead_bullets(self) -> None:
+        """
+        Drop the killed bullets from the SoA arrays
+        """
+
+        alive = np.array([b.alive() for b in self._bullet_sprites], dtype=bool)
+        if alive.all():
+            return
+
+        self._bullet_sprites = [b for b in self._bullet_sprites if b.alive()]
+        self._bullet_pos = self._bullet_pos[alive]
+        self._bullet_vel = self._bullet_vel[alive]
+        self._bullet_half = self._bullet_half[alive]
+
+    def update_bullets(self) -> None:
+        """
+        Step all the bullets in one vectorized pass and cull the ones
+        that left the screen
+        """
+
+        pos = self._bullet_pos
+        if not len(pos):
+            return
+
+        half = self._bullet_half
+        if _step_bullets_kernel is not None:
+            off = np.empty(len(pos), dtype=np.bool_)
+            _step_bullets_kernel(pos, self._bullet_vel, half, WIDTH, off)
+        else:
+            pos += self._bullet_vel
+            off = (
+                (pos[:, 1] - half[:, 1] <= 0)
+                | (pos[:, 0] - half[:, 0] <= 0)
+                | (pos[:, 0] + half[:, 0] >= WIDTH)
+            )
+
+        # One vectorized cast, then plain-int pairs for the write-back
+        for sprite, center in zip(self._bullet_sprites, pos.astype(np.int32).tolist()):
+            sprite.rect.center = center
+
+        if off.any():
+            for sprite, gone in zip(self._bullet_sprites, off):
+                if gone:
+                    sprite.kill()
+            self.drop_dead_bullets()
 
     def boost(self) -> None:
         """
@@ -122,28 +255,28 @@ class Ship(pygame.sprite.Sprite):
         
         if self.is_shooting and self._cooldown > 0:
             self._cooldown -= time
-            self._logger.log(f'Cooldown: {self._cooldown}')
+            self._logger.log('Cooldown: %s', self._cooldown)
             return
         
         if self._bullet_boost:
             # Shoot 3 bullets at once
-            bullet_center = Bullet((255, 0, 0), (5, 10), (self.rect.centerx, self.rect.top), 3)
-            bullet_left = Bullet((255, 0, 0), (5, 10), (self.rect.centerx - 10, self.rect.top), 5, diagonal_speed=2)
-            bullet_right = Bullet((255, 0, 0), (5, 10), (self.rect.centerx + 10, self.rect.top), 5, diagonal_speed=-2)
+            bullet_center = _acquire_bullet(_CENTER_SHOT, (self.rect.centerx, self.rect.top))
+            bullet_left = _acquire_bullet(_LEFT_SHOT, (self.rect.centerx - 10, self.rect.top))
+            bullet_right = _acquire_bullet(_RIGHT_SHOT, (self.rect.centerx + 10, self.rect.top))
             
-            self.bullets.append(bullet_center)
-            self.bullets.append(bullet_left)
-            self.bullets.append(bullet_right)
+            self.bullets.add(bullet_center, bullet_left, bullet_right)
+            self._sync_bullet_arrays()
             
             self._bullet_boost = False
             self._cooldown = 10
             
-            self._logger.log(f'Shooting bullets at {bullet_center.rect.center}, {bullet_left.rect.center}, {bullet_right.rect.center}')
+            self._logger.log('Shooting bullets at %s, %s, %s', bullet_center.rect.center, bullet_left.rect.center, bullet_right.rect.center)
             return
             
-        bullet = Bullet((255, 0, 0), (5, 10), (self.rect.centerx, self.rect.top), 3)
+        bullet = _acquire_bullet(_CENTER_SHOT, (self.rect.centerx, self.rect.top))
         self.is_shooting = True
-        self.bullets.append(bullet)
+        self.bullets.add(bullet)
+        self._sync_bullet_arrays()
         self._cooldown = 10
         
-        self._logger.log(f'Shooting bullet at {bullet.rect.center}')
+        self._logger.log('Shooting bullet at %s', bullet.rect.center)
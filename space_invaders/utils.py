@@ -3,6 +3,7 @@ Space Invaders utils
 """
 
 
+import functools
 import logging
 
 import pygame
@@ -13,26 +14,31 @@ class Logger:
     """
     Logger class for Space Invaders
     """
-    
+
     def __init__(self) -> None:
-        
-        logging.basicConfig(level=logging.DEBUG)
 
-    def log(self, message: str) -> None:
+        logging.basicConfig(level=logging.INFO)
+        self._logger = logging.getLogger('space_invaders')
+
+    def log(self, message: str, *args) -> None:
         """
         Log a message.
+
+        Formatting is deferred to the logging module ('%s' style), so
+        disabled messages cost no string building on the hot path.
         """
-        
-        logging.debug(message)
+
+        self._logger.debug(message, *args)
 
 
 logger = Logger()
 
 
+@functools.lru_cache(maxsize=32)
 def load_image(filename: str, transparent: bool = False) -> pygame.Surface:
     """
-    Load an image
-    
+    Load an image, cached so repeated calls share one converted Surface
+
     :param filename: Name of the file
     :type filename: str
     
@@ -70,8 +76,9 @@ def set_screen(caption: str, width: int, height: int) -> pygame.Surface:
     :return: pygame.Surface
     """
     
-    screen = pygame.display.set_mode((width, height))
+    flags = pygame.DOUBLEBUF | pygame.SCALED
+    screen = pygame.display.set_mode((width, height), flags, vsync=1)
     pygame.display.set_caption(caption)
-    
+
     return screen
 